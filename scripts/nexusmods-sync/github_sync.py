@@ -1,14 +1,238 @@
 """GitHub Issues manager for syncing NexusMods bugs."""
 
+import functools
 import re
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
 
-from github import Github
-from github.Issue import Issue
-from github.Repository import Repository
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 
 from nexusmods_scraper import BugReport
 
+_CONTENT_HASH_RE = re.compile(r"<!-- content-hash:([a-f0-9]+) -->")
+_NORMALIZED_HASH_RE = re.compile(r"<!-- normalized-hash:([a-f0-9]+) -->")
+_BUG_ID_RE = re.compile(r"\[NexusMods Bug #(\d+)\]")
+
+REST_API_URL = "https://api.github.com"
+GRAPHQL_URL = "https://api.github.com/graphql"
+EXISTING_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $label: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, labels: [$label], states: [OPEN, CLOSED], after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { number url title body }
+    }
+  }
+}
+"""
+GRAPHQL_AUTH_ERRORS = {"FORBIDDEN", "INSUFFICIENT_SCOPES", "UNAUTHORIZED"}
+
+_ISSUE_BODY_HEADER = "## Bug Report from NexusMods\n\n"
+_ISSUE_METADATA_HEADER = "\n\n---\n\n### Metadata\n"
+_NO_DESCRIPTION = "*No description provided*"
+
+
+class GitHubAPIError(Exception):
+    """Raised when the GitHub API returns an error response."""
+
+    def __init__(self, status: int, data: Any, headers: dict):
+        super().__init__(f"{status} {data}")
+        self.status = status
+        self.data = data
+        self.headers = headers
+
+
+class GraphQLAuthError(Exception):
+    """Raised when the token cannot be used for GraphQL queries."""
+
+
+@dataclass
+class SyncedIssue:
+    """Minimal view of an existing GitHub issue created by the sync."""
+
+    number: int
+    html_url: str
+    title: str
+    content_hash: Optional[str]
+    normalized_hash: Optional[str] = None
+
+
+def _retry_on_rate_limit(func, retries: int = 5, base_delay: float = 2.0):
+    """Retry a GitHub call with exponential backoff on rate-limit responses."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(retries):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                # Both GitHubAPIError and PyGithub's GithubException carry these.
+                status = getattr(e, "status", None)
+                rate_limited = status == 429 or (
+                    status == 403 and "rate limit" in str(getattr(e, "data", "")).lower()
+                )
+                if not rate_limited or attempt == retries - 1:
+                    raise
+                retry_after = (getattr(e, "headers", None) or {}).get("retry-after")
+                wait_time = float(retry_after) if retry_after else base_delay * (2 ** attempt)
+                print(f"  Rate limited, retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
+
+    return wrapper
+
+
+class _GhClient:
+    """Minimal GitHub API client covering the endpoints the sync uses."""
+
+    def __init__(self, token: str, repo: str):
+        """
+        Initialize the client.
+
+        Args:
+            token: GitHub API token
+            repo: Repository in "owner/repo" format
+        """
+        self.repo = repo
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+        )
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=20))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, raising GitHubAPIError on 4xx/5xx responses."""
+        if url.startswith("/"):
+            url = f"{REST_API_URL}{url}"
+        response = self.session.request(method, url, timeout=30, **kwargs)
+        if response.status_code >= 400:
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                data = response.text
+            raise GitHubAPIError(response.status_code, data, response.headers)
+        return response
+
+    def request_json(self, method: str, url: str, **kwargs) -> Any:
+        """Send a request and decode the JSON response."""
+        return orjson.loads(self.request(method, url, **kwargs).content)
+
+    def _paginate(self, url: str, **kwargs) -> Iterator[Any]:
+        """Yield each decoded page, following Link rel="next" headers."""
+        next_url: Optional[str] = url
+        while next_url:
+            response = self.request("GET", next_url, **kwargs)
+            yield orjson.loads(response.content)
+            next_url = response.links.get("next", {}).get("url")
+            kwargs.pop("params", None)
+
+    def get_label_names(self) -> set[str]:
+        """Return the names of all repository labels."""
+        return {
+            label["name"]
+            for page in self._paginate(f"/repos/{self.repo}/labels", params={"per_page": 100})
+            for label in page
+        }
+
+    def create_label(self, name: str, color: str, description: str) -> None:
+        """Create a repository label."""
+        self.request(
+            "POST",
+            f"/repos/{self.repo}/labels",
+            json={"name": name, "color": color, "description": description},
+        )
+
+    def create_issue(self, title: str, body: str, labels: list[str]) -> dict:
+        """Create an issue and return its JSON representation."""
+        return self.request_json(
+            "POST",
+            f"/repos/{self.repo}/issues",
+            json={"title": title, "body": body, "labels": labels},
+        )
+
+    def edit_issue(self, number: int, body: str) -> None:
+        """Replace an issue's body."""
+        self.request("PATCH", f"/repos/{self.repo}/issues/{number}", json={"body": body})
+
+    def search_issues(self, query: str) -> list[dict]:
+        """Search issues, collecting every result page."""
+        return [
+            item
+            for page in self._paginate(
+                "/search/issues", params={"q": query, "per_page": 100}
+            )
+            for item in page["items"]
+        ]
+
+    def get_rate_limit(self) -> tuple[int, float]:
+        """Return the remaining core requests and the reset time as a timestamp."""
+        core = self.request_json("GET", "/rate_limit")["resources"]["core"]
+        return core["remaining"], float(core["reset"])
+
+    def graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL query and return the decoded response."""
+        return self.request_json(
+            "POST", GRAPHQL_URL, json={"query": query, "variables": variables}
+        )
+
+
+class _PyGithubClient(_GhClient):
+    """Client that performs label, issue, search and rate-limit calls via PyGithub."""
+
+    def __init__(self, token: str, repo: str):
+        super().__init__(token, repo)
+        # PyGithub is only needed when this client is selected.
+        try:
+            from github import Github
+        except ImportError as e:
+            raise ImportError(
+                "PyGithub is not installed; install requirements-pygithub.txt to use --pygithub"
+            ) from e
+
+        self.github = Github(token)
+        self._repo = self.github.get_repo(repo)
+
+    def get_label_names(self) -> set[str]:
+        """Return the names of all repository labels."""
+        return {label.name for label in self._repo.get_labels()}
+
+    def create_label(self, name: str, color: str, description: str) -> None:
+        """Create a repository label."""
+        self._repo.create_label(name=name, color=color, description=description)
+
+    def create_issue(self, title: str, body: str, labels: list[str]) -> dict:
+        """Create an issue and return its number and URL."""
+        issue = self._repo.create_issue(title=title, body=body, labels=labels)
+        return {"number": issue.number, "html_url": issue.html_url}
+
+    def edit_issue(self, number: int, body: str) -> None:
+        """Replace an issue's body."""
+        self._repo.get_issue(number).edit(body=body)
+
+    def search_issues(self, query: str) -> list[dict]:
+        """Search issues, collecting every result page."""
+        # Search hits are incomplete objects; raw_data would fetch each issue
+        # again, while these attributes come with the search response.
+        return [
+            {"number": issue.number, "html_url": issue.html_url, "title": issue.title, "body": issue.body}
+            for issue in self.github.search_issues(query)
+        ]
+
+    def get_rate_limit(self) -> tuple[int, float]:
+        """Return the remaining core requests and the reset time as a timestamp."""
+        overview = self.github.get_rate_limit()
+        core = getattr(overview, "resources", overview).core
+        return core.remaining, core.reset.timestamp()
+
 
 class GitHubSync:
     """Manages GitHub Issues for NexusMods bug sync."""
@@ -16,8 +240,20 @@ class GitHubSync:
     NEXUSMODS_LABEL = "nexusmods-bug"
     SYNCED_LABEL = "synced"
     TITLE_PREFIX = "[NexusMods Bug #"
-
-    def __init__(self, token: str, repo: str, dry_run: bool = False):
+    RATE_LIMIT_THRESHOLD = 100
+    # GitHub search allows at most five AND/OR/NOT operators per query.
+    SEARCH_BATCH_SIZE = 6
+    ETAG_CACHE_PATH = Path(__file__).with_name("etag_cache.json")
+
+    def __init__(
+        self,
+        token: str,
+        repo: str,
+        dry_run: bool = False,
+        max_workers: int = 10,
+        max_concurrent_writes: int = 3,
+        use_pygithub: bool = False,
+    ):
         """
         Initialize GitHub sync.
 
@@ -25,26 +261,35 @@ class GitHubSync:
             token: GitHub API token
             repo: Repository in "owner/repo" format
             dry_run: If True, don't create/update issues, just report what would happen
+            max_workers: Number of bugs synced in parallel
+            max_concurrent_writes: Maximum issue creations/edits in flight at once
+            use_pygithub: Use PyGithub instead of the built-in REST client for
+                label, issue, search and rate-limit calls
         """
-        self.github = Github(token)
-        self.repo: Repository = self.github.get_repo(repo)
+        client_class = _PyGithubClient if use_pygithub else _GhClient
+        self.client = client_class(token, repo)
         self.dry_run = dry_run
+        self.max_workers = max_workers
+        self._write_semaphore = threading.Semaphore(max_concurrent_writes)
+        self._issue_index: Optional[dict[str, SyncedIssue]] = None
+        self._searched_ids: set[str] = set()
+        self._index_lock = threading.Lock()
         if not dry_run:
             self._ensure_labels()
 
     def _ensure_labels(self) -> None:
         """Ensure required labels exist in the repository."""
-        existing_labels = {label.name for label in self.repo.get_labels()}
+        existing_labels = self.client.get_label_names()
 
         if self.NEXUSMODS_LABEL not in existing_labels:
-            self.repo.create_label(
+            self.client.create_label(
                 name=self.NEXUSMODS_LABEL,
                 color="7B68EE",
                 description="Bug report synced from NexusMods",
             )
 
         if self.SYNCED_LABEL not in existing_labels:
-            self.repo.create_label(
+            self.client.create_label(
                 name=self.SYNCED_LABEL,
                 color="0E8A16",
                 description="Automatically synced issue",
@@ -56,53 +301,270 @@ class GitHubSync:
 
     def _make_issue_body(self, bug: BugReport) -> str:
         """Generate GitHub issue body from bug report."""
-        body_parts = [
-            "## Bug Report from NexusMods",
-            "",
-            bug.description or "*No description provided*",
-            "",
-            "---",
-            "",
-            "### Metadata",
-            f"- **Original URL:** {bug.url}",
-            f"- **Author:** {bug.author}",
-            f"- **Date Posted:** {bug.date_posted}",
-            f"- **Status on NexusMods:** {bug.status}",
-            "",
-            f"<!-- nexusmods-bug-id:{bug.bug_id} -->",
-            f"<!-- content-hash:{bug.content_hash()} -->",
-        ]
-        return "\n".join(body_parts)
+        return (
+            f"{_ISSUE_BODY_HEADER}{bug.description or _NO_DESCRIPTION}{_ISSUE_METADATA_HEADER}"
+            f"- **Original URL:** {bug.url}\n"
+            f"- **Author:** {bug.author}\n"
+            f"- **Date Posted:** {bug.date_posted}\n"
+            f"- **Status on NexusMods:** {bug.status}\n\n"
+            f"<!-- nexusmods-bug-id:{bug.bug_id} -->\n"
+            f"<!-- content-hash:{bug.content_hash} -->\n"
+            f"<!-- normalized-hash:{bug.normalized_hash} -->"
+        )
+
+    def _extract_normalized_hash(self, body: str) -> Optional[str]:
+        """Extract normalized content hash from issue body."""
+        match = _NORMALIZED_HASH_RE.search(body)
+        return match.group(1) if match else None
+
+    def _make_synced_issue(
+        self, number: int, html_url: str, title: str, body: Optional[str]
+    ) -> SyncedIssue:
+        """Build a SyncedIssue, keeping only the hashes from the issue body."""
+        body = body or ""
+        return SyncedIssue(
+            number=number,
+            html_url=html_url,
+            title=title,
+            content_hash=self._extract_content_hash(body),
+            normalized_hash=self._extract_normalized_hash(body),
+        )
 
     def _extract_content_hash(self, body: str) -> Optional[str]:
         """Extract content hash from issue body."""
-        match = re.search(r"<!-- content-hash:([a-f0-9]+) -->", body)
+        match = _CONTENT_HASH_RE.search(body)
         return match.group(1) if match else None
 
-    def _find_existing_issue(self, bug_id: str) -> Optional[Issue]:
-        """Find existing GitHub issue for a NexusMods bug ID."""
-        search_query = f'repo:{self.repo.full_name} "{self.TITLE_PREFIX}{bug_id}]" in:title'
+    def _load_existing_issues(self) -> dict[str, SyncedIssue]:
+        """
+        Fetch every synced issue once and index it by NexusMods bug ID.
 
-        try:
-            results = self.github.search_issues(search_query)
-            for issue in results:
-                if f"{self.TITLE_PREFIX}{bug_id}]" in issue.title:
-                    return issue
-        except Exception as e:
-            print(f"Error searching for issue: {e}")
+        Uses a paginated GraphQL query, falling back to the REST listing if the
+        token is not allowed to use GraphQL.
 
-        # Fallback: iterate through labeled issues
+        Returns:
+            Dict mapping bug ID to its GitHub issue
+        """
         try:
-            issues = self.repo.get_issues(
-                state="all", labels=[self.NEXUSMODS_LABEL]
+            issues = self._fetch_issues_graphql()
+        except GraphQLAuthError as e:
+            print(f"GraphQL unavailable ({e}), falling back to REST listing")
+            issues = self._fetch_issues_rest()
+
+        existing_issues: dict[str, SyncedIssue] = {}
+        for issue in issues:
+            match = _BUG_ID_RE.match(issue.title)
+            if match:
+                existing_issues.setdefault(match.group(1), issue)
+        return existing_issues
+
+    def _fetch_issues_graphql(self) -> list[SyncedIssue]:
+        """Fetch all labeled issues through the GraphQL API."""
+        owner, name = self.client.repo.split("/", 1)
+        variables = {
+            "owner": owner,
+            "name": name,
+            "label": self.NEXUSMODS_LABEL,
+            "cursor": None,
+        }
+        issues = []
+
+        while True:
+            try:
+                payload = self.client.graphql(EXISTING_ISSUES_QUERY, variables)
+            except GitHubAPIError as e:
+                if e.status in (401, 403):
+                    raise GraphQLAuthError(f"HTTP {e.status}") from e
+                raise
+
+            errors = payload.get("errors")
+            if errors:
+                if any(error.get("type") in GRAPHQL_AUTH_ERRORS for error in errors):
+                    raise GraphQLAuthError(errors[0].get("message", "access denied"))
+                raise RuntimeError(f"GraphQL query failed: {errors}")
+
+            connection = payload["data"]["repository"]["issues"]
+            issues.extend(
+                self._make_synced_issue(
+                    node["number"], node["url"], node["title"], node["body"]
+                )
+                for node in connection["nodes"]
             )
+
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return issues
+            variables["cursor"] = page_info["endCursor"]
+
+    def _fetch_issues_rest(self) -> list[SyncedIssue]:
+        """
+        Fetch all labeled issues through the REST API.
+
+        Each listing page is requested with the ETag from the previous run, so
+        unchanged pages come back as 304 responses that don't count against
+        the rate limit and are served from the local cache.
+        """
+        cache = self._load_etag_cache()
+        fresh_cache: dict[str, dict] = {}
+        issues: list[SyncedIssue] = []
+        url: Optional[str] = (
+            f"{REST_API_URL}/repos/{self.client.repo}/issues"
+            f"?state=all&labels={self.NEXUSMODS_LABEL}&per_page=100"
+        )
+
+        while url:
+            cached_page = cache.get(url)
+            headers = {}
+            if cached_page and cached_page.get("etag"):
+                headers["If-None-Match"] = cached_page["etag"]
+
+            response = self.client.request("GET", url, headers=headers)
+            if response.status_code == 304:
+                page = cached_page
+            else:
+                page = {
+                    "etag": response.headers.get("ETag"),
+                    "next": response.links.get("next", {}).get("url"),
+                    "issues": [
+                        asdict(
+                            self._make_synced_issue(
+                                item["number"], item["html_url"], item["title"], item["body"]
+                            )
+                        )
+                        for item in orjson.loads(response.content)
+                        if "pull_request" not in item
+                    ],
+                }
+
+            fresh_cache[url] = page
+            issues.extend(SyncedIssue(**item) for item in page["issues"])
+            url = page["next"]
+
+        self._save_etag_cache(fresh_cache)
+        return issues
+
+    def _load_etag_cache(self) -> dict[str, dict]:
+        """Load cached listing pages keyed by URL."""
+        try:
+            return orjson.loads(self.ETAG_CACHE_PATH.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_etag_cache(self, cache: dict[str, dict]) -> None:
+        """Persist cached listing pages for the next run."""
+        try:
+            self.ETAG_CACHE_PATH.write_bytes(orjson.dumps(cache))
+        except OSError as e:
+            print(f"Error saving ETag cache: {e}")
+
+    def _search_existing_issues(self, bug_ids: list[str]) -> dict[str, SyncedIssue]:
+        """
+        Look up issues by title for bugs missing from the labeled index.
+
+        Catches synced issues whose label was removed, several bug IDs per
+        search query.
+
+        Args:
+            bug_ids: NexusMods bug IDs to look for
+
+        Returns:
+            Dict mapping bug ID to its GitHub issue for the IDs that were found
+        """
+        found: dict[str, SyncedIssue] = {}
+
+        for start in range(0, len(bug_ids), self.SEARCH_BATCH_SIZE):
+            chunk = bug_ids[start:start + self.SEARCH_BATCH_SIZE]
+            # Title prefix for each bug ID, built once and reused for the query
+            # and for checking results.
+            targets = {f"{self.TITLE_PREFIX}{bug_id}]": bug_id for bug_id in chunk}
+            prefixes = tuple(targets)
+            terms = " OR ".join(f'"{target}"' for target in prefixes)
+            query = f"repo:{self.client.repo} is:issue in:title ({terms})"
+
+            try:
+                issues = self._search_issues(query)
+            except Exception as e:
+                print(f"Error searching for issues: {e}")
+                continue
+
             for issue in issues:
-                if f"{self.TITLE_PREFIX}{bug_id}]" in issue.title:
-                    return issue
+                title = issue["title"]
+                # Search matches loosely, but synced titles always start with
+                # the prefix, so an anchored check is enough to confirm a hit.
+                if not title.startswith(prefixes):
+                    continue
+                found.setdefault(
+                    targets[title[:title.index("]") + 1]],
+                    self._make_synced_issue(
+                        issue["number"], issue["html_url"], title, issue["body"]
+                    ),
+                )
+
+        return found
+
+    @_retry_on_rate_limit
+    def _search_issues(self, query: str) -> list[dict]:
+        """Run an issue search and collect every result page."""
+        return self.client.search_issues(query)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the core rate limit resets if it is nearly exhausted."""
+        try:
+            remaining, reset = self.client.get_rate_limit()
         except Exception as e:
-            print(f"Error listing issues: {e}")
+            print(f"Error checking rate limit: {e}")
+            return
+
+        if remaining >= self.RATE_LIMIT_THRESHOLD:
+            return
+
+        wait_time = max(0.0, reset - time.time()) + 1
+        print(f"Only {remaining} API requests left, waiting {wait_time:.0f}s for reset...")
+        time.sleep(wait_time)
 
-        return None
+    @_retry_on_rate_limit
+    def _create_issue(self, title: str, body: str, labels: list[str]) -> dict:
+        """Create an issue, bounded by the write semaphore."""
+        with self._write_semaphore:
+            return self.client.create_issue(title, body, labels)
+
+    @_retry_on_rate_limit
+    def _edit_issue(self, issue: SyncedIssue, body: str) -> None:
+        """Edit an issue body, bounded by the write semaphore."""
+        with self._write_semaphore:
+            self.client.edit_issue(issue.number, body)
+
+    def _find_existing_issue(self, bug_id: str) -> Optional[SyncedIssue]:
+        """
+        Find existing GitHub issue for a NexusMods bug ID.
+
+        The issue index is built on first use and shared by later lookups.
+        Bugs missing from it (e.g. beyond the listed issues) are looked up
+        once through the search API, as ``_prefetch_issues`` does in bulk.
+        """
+        index = self._issue_index
+        if index is not None and (bug_id in index or bug_id in self._searched_ids):
+            return index.get(bug_id)
+        with self._index_lock:
+            if self._issue_index is None:
+                self._issue_index = self._load_existing_issues()
+            if bug_id not in self._issue_index and bug_id not in self._searched_ids:
+                self._issue_index.update(self._search_existing_issues([bug_id]))
+                self._searched_ids.add(bug_id)
+            return self._issue_index.get(bug_id)
+
+    def _remember_issue(self, bug: BugReport, number: int, html_url: str) -> None:
+        """Record a created or edited issue so later lookups in this run see it."""
+        issue = SyncedIssue(
+            number=number,
+            html_url=html_url,
+            title=self._make_issue_title(bug),
+            content_hash=bug.content_hash,
+            normalized_hash=bug.normalized_hash,
+        )
+        with self._index_lock:
+            if self._issue_index is not None:
+                self._issue_index[bug.bug_id] = issue
 
     def sync_bug(self, bug: BugReport) -> dict:
         """
@@ -125,14 +587,19 @@ class GitHubSync:
         dry_run_prefix = "[DRY RUN] " if self.dry_run else ""
 
         if existing_issue:
-            existing_hash = self._extract_content_hash(existing_issue.body or "")
-            new_hash = bug.content_hash()
+            existing_hash = existing_issue.content_hash
+            new_hash = bug.content_hash
 
             if existing_hash == new_hash:
                 result["action"] = "unchanged"
                 result["issue_number"] = existing_issue.number
                 result["issue_url"] = existing_issue.html_url
                 print(f"{dry_run_prefix}Bug #{bug.bug_id}: No changes detected")
+            elif existing_issue.normalized_hash == bug.normalized_hash:
+                result["action"] = "unchanged"
+                result["issue_number"] = existing_issue.number
+                result["issue_url"] = existing_issue.html_url
+                print(f"{dry_run_prefix}Bug #{bug.bug_id}: Only whitespace changes, skipping update")
             else:
                 if self.dry_run:
                     result["action"] = "would_update"
@@ -141,7 +608,8 @@ class GitHubSync:
                     print(f"{dry_run_prefix}Bug #{bug.bug_id}: Would update issue #{existing_issue.number}")
                 else:
                     new_body = self._make_issue_body(bug)
-                    existing_issue.edit(body=new_body)
+                    self._edit_issue(existing_issue, new_body)
+                    self._remember_issue(bug, existing_issue.number, existing_issue.html_url)
                     result["action"] = "updated"
                     result["issue_number"] = existing_issue.number
                     result["issue_url"] = existing_issue.html_url
@@ -158,33 +626,71 @@ class GitHubSync:
                 body = self._make_issue_body(bug)
                 labels = [self.NEXUSMODS_LABEL, self.SYNCED_LABEL]
 
-                new_issue = self.repo.create_issue(
-                    title=title,
-                    body=body,
-                    labels=labels,
-                )
+                new_issue = self._create_issue(title, body, labels)
+                self._remember_issue(bug, new_issue["number"], new_issue["html_url"])
                 result["action"] = "created"
-                result["issue_number"] = new_issue.number
-                result["issue_url"] = new_issue.html_url
-                print(f"Bug #{bug.bug_id}: Created issue #{new_issue.number}")
+                result["issue_number"] = new_issue["number"]
+                result["issue_url"] = new_issue["html_url"]
+                print(f"Bug #{bug.bug_id}: Created issue #{new_issue['number']}")
 
         return result
 
-    def sync_bugs(self, bugs: list[BugReport]) -> list[dict]:
+    def _prefetch_issues(self, bug_ids: list[str]) -> None:
+        """Build the existing-issue index, searching for bugs missing from it."""
+        with self._index_lock:
+            existing_issues = self._load_existing_issues()
+            missing = [bug_id for bug_id in bug_ids if bug_id not in existing_issues]
+            if missing:
+                existing_issues.update(self._search_existing_issues(missing))
+            self._issue_index = existing_issues
+            self._searched_ids.update(bug_ids)
+        self._wait_for_rate_limit()
+
+    def sync_bugs(
+        self, bugs: Iterable[BugReport], bug_ids: Optional[list[str]] = None
+    ) -> list[dict]:
         """
         Sync multiple bug reports to GitHub Issues.
 
+        Bugs are submitted for syncing as soon as the iterable yields them, so a
+        lazy source (e.g. NexusModsScraper.iter_bug_details) overlaps with the
+        GitHub prefetch and with syncing earlier bugs.
+
         Args:
-            bugs: List of BugReport objects to sync
+            bugs: BugReport objects to sync
+            bug_ids: IDs of every bug in ``bugs``; required up front to prefetch
+                existing issues while a lazy ``bugs`` is still producing
 
         Returns:
-            List of sync result dicts
+            List of sync result dicts, in the order of ``bugs``; repeated bug
+            IDs are synced once, on their first occurrence
         """
-        results = []
-        for bug in bugs:
-            result = self.sync_bug(bug)
-            results.append(result)
-        return results
+        if bug_ids is None:
+            bugs = list(bugs)
+            bug_ids = [bug.bug_id for bug in bugs]
+        bug_ids = list(dict.fromkeys(bug_ids))
+
+        def unique_bugs() -> Iterator[BugReport]:
+            # Parallel tasks for the same ID would both miss the index and
+            # create two issues, so duplicates are dropped before submitting.
+            seen_ids: set[str] = set()
+            for bug in bugs:
+                if bug.bug_id in seen_ids:
+                    print(f"Bug #{bug.bug_id}: Duplicate entry, skipping")
+                    continue
+                seen_ids.add(bug.bug_id)
+                yield bug
+
+        def sync_when_ready(bug: BugReport) -> dict:
+            prefetch.result()
+            return self.sync_bug(bug)
+
+        # The prefetch takes one worker; sync tasks wait on it before looking
+        # up their issue, while new bugs keep arriving from ``bugs``.
+        with ThreadPoolExecutor(max_workers=self.max_workers + 1) as executor:
+            prefetch = executor.submit(self._prefetch_issues, bug_ids)
+            futures = [executor.submit(sync_when_ready, bug) for bug in unique_bugs()]
+            return [future.result() for future in futures]
 
     def get_sync_summary(self, results: list[dict]) -> str:
         """Generate a summary of sync results."""
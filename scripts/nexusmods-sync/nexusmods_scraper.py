@@ -1,13 +1,24 @@
 """NexusMods bug report scraper."""
 
+import functools
+import hashlib
+import math
 import random
 import re
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterator, Optional
 
 import cloudscraper
-from bs4 import BeautifulSoup
+import requests
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from cloudscraper.exceptions import CloudflareException
+from lxml import etree
 
 BROWSER_CONFIGS = [
     {"browser": "chrome", "platform": "windows", "mobile": False},
@@ -16,8 +27,42 @@ BROWSER_CONFIGS = [
     {"browser": "firefox", "platform": "linux", "mobile": False},
 ]
 
-
-@dataclass
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "nexusmods-sync.db"
+
+# Only the subtrees the scraper reads are kept when parsing. Pagination may sit
+# outside <main>, so every container it can live in (including a
+# div.pagination) is kept on listing pages too.
+BUG_LIST_STRAINER = SoupStrainer(["main", "table", "tr", "nav", "div", "ul", "a"])
+BUG_DETAIL_STRAINER = SoupStrainer(["main", "article", "section", "div"])
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# CSS selectors are compiled once instead of being re-parsed on every call.
+_BUG_ROW_SEL = soupsieve.compile("table.forum-bugs tbody tr.mod-issue-row")
+_BUG_ROW_FALLBACK_SEL = soupsieve.compile("tr[data-issue-id]")
+_NEXT_PAGE_SEL = soupsieve.compile(
+    "a.next, a[rel='next'], .pagination .next, a[aria-label='Next']"
+)
+_TITLE_SEL = soupsieve.compile(".issue-title")
+_STATUS_SEL = soupsieve.compile(".table-bug-status span")
+_DATE_SEL = soupsieve.compile("time")
+# Description selectors in order of preference. The combined selector finds
+# every candidate in one walk; the individual ones only rank those matches.
+_DESC_SELECTORS = (
+    ".bug-description",
+    ".description",
+    ".bug-content",
+    ".comment-content",
+    "article",
+    ".bug-report-body",
+)
+_DESC_SEL = soupsieve.compile(", ".join(_DESC_SELECTORS))
+_DESC_RANK_SELS = tuple(soupsieve.compile(selector) for selector in _DESC_SELECTORS)
+_MAIN_CONTENT_SEL = soupsieve.compile("main, .main-content, #content")
+_PARAGRAPH_SEL = soupsieve.compile("p")
+
+
+@dataclass(frozen=True)
 class BugReport:
     """Represents a bug report from NexusMods."""
 
@@ -29,12 +74,107 @@ class BugReport:
     status: str
     url: str
 
+    @functools.cached_property
     def content_hash(self) -> str:
-        """Generate a hash of the bug content for change detection."""
-        import hashlib
+        """Hash of the bug content for change detection, computed once."""
+        content = b"|".join(
+            (self.title.encode(), self.description.encode(), self.status.encode())
+        )
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    @functools.cached_property
+    def normalized_hash(self) -> str:
+        """Hash of the bug content with whitespace collapsed, computed once."""
+        description = _WHITESPACE_RE.sub(" ", self.description).strip()
+        content = f"{description}|{self.title}|{self.status}".encode()
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class TokenBucket:
+    """Thread-safe token bucket that caps the aggregate request rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
 
-        content = f"{self.title}|{self.description}|{self.status}"
-        return hashlib.md5(content.encode()).hexdigest()
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        if math.isinf(self.rate):
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+class BugCache:
+    """SQLite cache of bug descriptions, keyed by each bug's listing row."""
+
+    # Descriptions can be edited without touching the listing row, so cached
+    # entries are refetched once they get this old.
+    MAX_AGE = 7 * 24 * 60 * 60
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bugs ("
+                "bug_id TEXT PRIMARY KEY, "
+                "list_hash TEXT NOT NULL, "
+                "description TEXT NOT NULL, "
+                "last_fetched REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def list_hash(bug: BugReport) -> str:
+        """Hash the fields shown in the bug listing."""
+        content = f"{bug.title}|{bug.status}|{bug.date_posted}".encode()
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def get_description(self, bug: BugReport) -> Optional[str]:
+        """Return the cached description if the listing row is unchanged."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description FROM bugs "
+                "WHERE bug_id = ? AND list_hash = ? AND last_fetched > ?",
+                (bug.bug_id, self.list_hash(bug), time.time() - self.MAX_AGE),
+            ).fetchone()
+        return row[0] if row else None
+
+    def store(self, bug: BugReport) -> None:
+        """Store a bug's fetched description."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bugs "
+                "(bug_id, list_hash, description, last_fetched) VALUES (?, ?, ?, ?)",
+                (bug.bug_id, self.list_hash(bug), bug.description, time.time()),
+            )
 
 
 class NexusModsScraper:
@@ -47,7 +187,14 @@ class NexusModsScraper:
         "Chrome/120.0.0.0 Safari/537.36"
     )
 
-    def __init__(self, game: str, mod_id: str, delay: float = 1.0):
+    def __init__(
+        self,
+        game: str,
+        mod_id: str,
+        delay: float = 1.0,
+        workers: int = 4,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+    ):
         """
         Initialize the scraper.
 
@@ -55,13 +202,49 @@ class NexusModsScraper:
             game: Game identifier (e.g., "skyrimspecialedition")
             mod_id: Mod ID number
             delay: Delay between requests in seconds (to avoid rate limiting)
+            workers: Number of bug detail pages fetched in parallel
+            cache_path: SQLite cache of fetched descriptions, or None to disable
         """
         self.game = game
         self.mod_id = mod_id
         self.delay = delay
-        self.session = cloudscraper.create_scraper(
-            browser=random.choice(BROWSER_CONFIGS)
+        self.workers = workers
+        self.cache = BugCache(cache_path) if cache_path else None
+        self._rate_limiter = TokenBucket(
+            rate=1 / delay if delay > 0 else math.inf,
+            capacity=workers,
+        )
+        self.session = self._create_session(random.choice(BROWSER_CONFIGS))
+        self._session_lock = threading.Lock()
+
+    @staticmethod
+    def _create_session(browser_config: dict) -> cloudscraper.CloudScraper:
+        """Create a scraper session with a connection pool sized for reuse."""
+        session = cloudscraper.create_scraper(browser=browser_config)
+        # Re-mount cloudscraper's cipher suite adapter with a larger pool so
+        # page and detail fetches keep reusing warm TLS connections.
+        adapter = session.get_adapter("https://")
+        session.mount(
+            "https://",
+            cloudscraper.CipherSuiteAdapter(
+                ssl_context=adapter.ssl_context,
+                source_address=adapter.source_address,
+                pool_connections=20,
+                pool_maxsize=20,
+                max_retries=0,
+            ),
         )
+        return session
+
+    @staticmethod
+    def _is_cloudflare_block(error: Exception) -> bool:
+        """Check whether a fetch failed because Cloudflare rejected the session."""
+        if isinstance(error, CloudflareException):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            server = error.response.headers.get("Server", "").lower()
+            return error.response.status_code in (403, 503) and server == "cloudflare"
+        return False
 
     def _get_bugs_url(self, page: int = 1) -> str:
         """Get the URL for the bugs tab."""
@@ -70,122 +253,217 @@ class NexusModsScraper:
             url += f"&BusLoadAllRecords=false&page={page}"
         return url
 
-    def _fetch_page(self, url: str, retries: int = 5) -> Optional[BeautifulSoup]:
-        """Fetch and parse a page with retry logic."""
+    def _fetch_page(
+        self,
+        url: str,
+        retries: int = 5,
+        parse_only: Optional[SoupStrainer] = None,
+        stop_at_bug_table: bool = False,
+    ) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a page with retry logic.
+
+        Args:
+            url: Page URL
+            retries: Number of attempts before giving up
+            parse_only: Strainer limiting which parts of the page are parsed
+            stop_at_bug_table: Stop downloading once the bug table and its
+                pagination have been received
+        """
+        rotate_session = False
+        session = self.session
         for attempt in range(retries):
             try:
                 if attempt > 0:
                     wait_time = (2 ** attempt) + random.uniform(1, 3)
-                    browser_config = random.choice(BROWSER_CONFIGS)
-                    print(f"  Retry {attempt}/{retries-1} after {wait_time:.1f}s (trying {browser_config['browser']}/{browser_config['platform']})...")
-                    time.sleep(wait_time)
-                    self.session = cloudscraper.create_scraper(browser=browser_config)
+                    if rotate_session:
+                        browser_config = random.choice(BROWSER_CONFIGS)
+                        print(f"  Retry {attempt}/{retries-1} after {wait_time:.1f}s (trying {browser_config['browser']}/{browser_config['platform']})...")
+                        time.sleep(wait_time)
+                        # Workers blocked by the same challenge all land here;
+                        # only the first replaces the session they shared.
+                        with self._session_lock:
+                            if self.session is session:
+                                self.session = self._create_session(browser_config)
+                    else:
+                        print(f"  Retry {attempt}/{retries-1} after {wait_time:.1f}s...")
+                        time.sleep(wait_time)
                 else:
                     time.sleep(random.uniform(0.5, 2))
-                response = self.session.get(url, timeout=30)
+                session = self.session
+                response = session.get(url, timeout=30, stream=stop_at_bug_table)
                 response.raise_for_status()
-                return BeautifulSoup(response.text, "html.parser")
+                if stop_at_bug_table:
+                    content = self._read_until_bug_table(response)
+                else:
+                    content = response.content
+                return BeautifulSoup(content, "lxml", parse_only=parse_only)
             except Exception as e:
+                rotate_session = self._is_cloudflare_block(e)
                 if attempt == retries - 1:
                     print(f"Error fetching {url} after {retries} attempts: {e}")
                     return None
         return None
 
+    @staticmethod
+    def _is_next_page_link(element: etree._Element, classes: list[str]) -> bool:
+        """Mirror ``_NEXT_PAGE_SEL`` for an element that has just been parsed."""
+        if element.tag == "a" and (
+            "next" in classes
+            or element.get("rel") == "next"
+            or element.get("aria-label") == "Next"
+        ):
+            return True
+        return "next" in classes and any(
+            "pagination" in (ancestor.get("class") or "").split()
+            for ancestor in element.iterancestors()
+        )
+
+    @classmethod
+    def _read_until_bug_table(cls, response: requests.Response) -> bytes:
+        """
+        Stream a listing page until the bug table and its next-page link are closed.
+
+        Pagination may follow the table, so reading stops once an element
+        matching ``_NEXT_PAGE_SEL`` has closed after it. Other navigation in
+        between does not end the read, and pages without a next-page link
+        (such as the last one) are read in full.
+
+        Closing a partly read response discards its connection instead of
+        returning it to the pool, so each early stop costs one fresh TLS
+        handshake. That only happens once per listing page, which is cheap
+        next to the rest of the page it skips. Detail pages are read in full
+        and keep reusing pooled connections.
+        """
+        parser = etree.HTMLPullParser(events=("end",))
+        chunks = []
+        table_closed = False
+
+        try:
+            for chunk in response.iter_content(chunk_size=16 * 1024):
+                chunks.append(chunk)
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    classes = (element.get("class") or "").split()
+                    if element.tag == "table" and "forum-bugs" in classes:
+                        table_closed = True
+                    elif table_closed and cls._is_next_page_link(element, classes):
+                        return b"".join(chunks)
+                    # Only the events are needed, so drop parsed content early.
+                    element.clear()
+        finally:
+            response.close()
+
+        return b"".join(chunks)
+
     def _parse_bug_row(self, row) -> Optional[BugReport]:
         """Parse a bug report from a table row."""
-        try:
-            bug_id = row.get("data-issue-id")
-            if not bug_id:
-                return None
-
-            title_elem = row.select_one(".issue-title")
-            title = title_elem.get_text(strip=True) if title_elem else "Unknown"
-
-            url = f"{self.BASE_URL}/{self.game}/mods/{self.mod_id}?tab=bugs&issue_id={bug_id}"
-
-            status_elem = row.select_one(".table-bug-status span")
-            status = status_elem.get_text(strip=True) if status_elem else "Unknown"
-
-            date_elem = row.select_one("time")
-            if date_elem:
-                date_posted = date_elem.get("data-date") or date_elem.get_text(strip=True)
-            else:
-                date_posted = "Unknown"
-
-            return BugReport(
-                bug_id=bug_id,
-                title=title,
-                description="",
-                author="Unknown",
-                date_posted=date_posted,
-                status=status,
-                url=url,
-            )
-        except Exception as e:
-            print(f"Error parsing bug row: {e}")
+        bug_id = row.get("data-issue-id")
+        if not bug_id:
             return None
 
+        missing = []
+
+        if (title_elem := _TITLE_SEL.select_one(row)) is not None:
+            title = title_elem.get_text(strip=True)
+        else:
+            title = "Unknown"
+            missing.append("title")
+
+        if (status_elem := _STATUS_SEL.select_one(row)) is not None:
+            status = status_elem.get_text(strip=True)
+        else:
+            status = "Unknown"
+            missing.append("status")
+
+        if (date_elem := _DATE_SEL.select_one(row)) is not None:
+            date_posted = date_elem.get("data-date") or date_elem.get_text(strip=True)
+        else:
+            date_posted = "Unknown"
+            missing.append("date")
+
+        if missing:
+            print(f"  Bug #{bug_id}: row is missing {', '.join(missing)}")
+
+        return BugReport(
+            bug_id=bug_id,
+            title=title,
+            description="",
+            author="Unknown",
+            date_posted=date_posted,
+            status=status,
+            url=f"{self.BASE_URL}/{self.game}/mods/{self.mod_id}?tab=bugs&issue_id={bug_id}",
+        )
+
+    @staticmethod
+    def _select_description(soup: BeautifulSoup):
+        """Find the most preferred description element in a single tree walk."""
+        best_elem = None
+        best_rank = len(_DESC_RANK_SELS)
+
+        for elem in _DESC_SEL.iselect(soup):
+            rank = next(
+                i for i, selector in enumerate(_DESC_RANK_SELS) if selector.match(elem)
+            )
+            if rank < best_rank:
+                best_elem, best_rank = elem, rank
+                if rank == 0:
+                    break
+
+        return best_elem
+
     def _fetch_bug_details(self, bug: BugReport) -> BugReport:
         """Fetch full bug details from the bug's page."""
-        time.sleep(self.delay)
-        soup = self._fetch_page(bug.url)
+        self._rate_limiter.acquire()
+        soup = self._fetch_page(bug.url, parse_only=BUG_DETAIL_STRAINER)
         if not soup:
             return bug
 
         # Try to find the bug description
-        desc_selectors = [
-            ".bug-description",
-            ".description",
-            ".bug-content",
-            ".comment-content",
-            "article",
-            ".bug-report-body",
-        ]
-
-        for selector in desc_selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem:
-                bug.description = desc_elem.get_text(strip=True)
-                break
+        description = bug.description
+        desc_elem = self._select_description(soup)
+        if desc_elem:
+            description = desc_elem.get_text(strip=True)
 
         # If no description found, try the main content area
-        if not bug.description:
-            main_content = soup.select_one("main, .main-content, #content")
+        if not description:
+            main_content = _MAIN_CONTENT_SEL.select_one(soup)
             if main_content:
                 # Get first few paragraphs
-                paragraphs = main_content.select("p")
+                paragraphs = _PARAGRAPH_SEL.select(main_content)
                 if paragraphs:
-                    bug.description = "\n\n".join(
+                    description = "\n\n".join(
                         p.get_text(strip=True) for p in paragraphs[:3]
                     )
 
-        return bug
+        # BugReport is frozen so its cached content hash can't go stale.
+        return replace(bug, description=description)
 
-    def scrape_bugs(self, fetch_details: bool = True) -> list[BugReport]:
+    def scrape_bug_list(self) -> list[BugReport]:
         """
-        Scrape all bug reports from the mod's bugs tab.
-
-        Args:
-            fetch_details: Whether to fetch full details for each bug
+        Scrape the bug listing pages without fetching each bug's details.
 
         Returns:
-            List of BugReport objects
+            List of BugReport objects with empty descriptions
         """
         bugs = []
+        seen_ids: set[str] = set()
         page = 1
 
         while True:
             print(f"Fetching bugs page {page}...")
             url = self._get_bugs_url(page)
-            soup = self._fetch_page(url)
+            soup = self._fetch_page(
+                url, parse_only=BUG_LIST_STRAINER, stop_at_bug_table=True
+            )
 
             if not soup:
                 break
 
-            bug_rows = soup.select("table.forum-bugs tbody tr.mod-issue-row")
+            bug_rows = _BUG_ROW_SEL.select(soup)
 
             if not bug_rows:
-                bug_rows = soup.select("tr[data-issue-id]")
+                bug_rows = _BUG_ROW_FALLBACK_SEL.select(soup)
 
             if not bug_rows:
                 print(f"No bug rows found on page {page}")
@@ -200,25 +478,65 @@ class NexusModsScraper:
             if not page_bugs:
                 break
 
-            bugs.extend(page_bugs)
+            # A new report can push a row onto the next page between fetches.
+            for bug in page_bugs:
+                if bug.bug_id not in seen_ids:
+                    seen_ids.add(bug.bug_id)
+                    bugs.append(bug)
 
             # Check for next page
-            next_link = soup.select_one(
-                "a.next, a[rel='next'], .pagination .next, a[aria-label='Next']"
-            )
+            next_link = _NEXT_PAGE_SEL.select_one(soup)
             if not next_link:
                 break
 
             page += 1
             time.sleep(self.delay)
 
-        # Fetch full details for each bug
-        if fetch_details:
-            print(f"Fetching details for {len(bugs)} bugs...")
-            for i, bug in enumerate(bugs):
-                print(f"  Fetching bug {i + 1}/{len(bugs)}: {bug.bug_id}")
-                bugs[i] = self._fetch_bug_details(bug)
+        return bugs
+
+    def iter_bug_details(self, bugs: list[BugReport]) -> Iterator[BugReport]:
+        """
+        Fetch full details for each bug, yielding bugs as their pages arrive.
 
+        Args:
+            bugs: Bugs from scrape_bug_list
+
+        Yields:
+            BugReport objects with descriptions, in the order given
+        """
+        print(f"Fetching details for {len(bugs)} bugs...")
+
+        def fetch(indexed_bug: tuple[int, BugReport]) -> BugReport:
+            i, bug = indexed_bug
+            if self.cache:
+                description = self.cache.get_description(bug)
+                if description is not None:
+                    print(f"  Bug {i + 1}/{len(bugs)}: {bug.bug_id} unchanged, using cached details")
+                    return replace(bug, description=description)
+
+            print(f"  Fetching bug {i + 1}/{len(bugs)}: {bug.bug_id}")
+            bug = self._fetch_bug_details(bug)
+            # An empty description usually means the fetch failed; retry next run.
+            if self.cache and bug.description:
+                self.cache.store(bug)
+            return bug
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            yield from executor.map(fetch, enumerate(bugs))
+
+    def scrape_bugs(self, fetch_details: bool = True) -> list[BugReport]:
+        """
+        Scrape all bug reports from the mod's bugs tab.
+
+        Args:
+            fetch_details: Whether to fetch full details for each bug
+
+        Returns:
+            List of BugReport objects
+        """
+        bugs = self.scrape_bug_list()
+        if fetch_details:
+            bugs = list(self.iter_bug_details(bugs))
         return bugs
 
 
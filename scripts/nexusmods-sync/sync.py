@@ -38,6 +38,17 @@ def main():
         action="store_true",
         help="Test mode: scrape and check for existing issues, but don't create or update",
     )
+    parser.add_argument(
+        "--max-concurrent-writes",
+        type=int,
+        default=3,
+        help="Maximum number of GitHub issue creations/edits in flight at once (default: 3)",
+    )
+    parser.add_argument(
+        "--pygithub",
+        action="store_true",
+        help="Use PyGithub for GitHub API calls instead of the built-in REST client (requires requirements-pygithub.txt)",
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -61,7 +72,7 @@ def main():
 
     print("\n[Step 1] Scraping bugs from NexusMods...")
     scraper = NexusModsScraper(game, mod_id)
-    all_bugs = scraper.scrape_bugs(fetch_details=True)
+    all_bugs = scraper.scrape_bug_list()
 
     if not all_bugs:
         print("No bugs found on NexusMods. Nothing to sync.")
@@ -76,9 +87,20 @@ def main():
         print("No open bugs to sync.")
         return
 
-    print("\n[Step 2] Syncing to GitHub Issues...")
-    github_sync = GitHubSync(github_token, github_repo, dry_run=args.dry_run)
-    results = github_sync.sync_bugs(bugs)
+    print("\n[Step 2] Fetching bug details and syncing to GitHub Issues...")
+    github_sync = GitHubSync(
+        github_token,
+        github_repo,
+        dry_run=args.dry_run,
+        max_concurrent_writes=args.max_concurrent_writes,
+        use_pygithub=args.pygithub,
+    )
+    # Each bug is synced as soon as its details arrive, while the remaining
+    # detail pages are still being fetched.
+    results = github_sync.sync_bugs(
+        scraper.iter_bug_details(bugs),
+        bug_ids=[bug.bug_id for bug in bugs],
+    )
 
     print("\n" + "-" * 60)
     summary = github_sync.get_sync_summary(results)